@@ -5,29 +5,51 @@ from typing import Dict, Any
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .api import SesameTimeAPI
+from .api import SesameTimeAPI, WorkCheckTypeCatalog
+from .importer import async_import_employees, load_employee_file
+from .presence import async_get_presence
+from .profiler import CATEGORY_SERVICE, async_get_profiler
+from .tracing import RequestTracer
+from .worktime import WorkTimeTracker, async_remove_work_time
 from .const import (
     DOMAIN,
+    DATA_CHECK_TYPES,
     CONF_REGION,
     CONF_TOKEN,
     CONF_EMPLOYEE_ID,
     CONF_COMPANY_ID,
+    CONF_EMPLOYEE_NAME,
+    CONF_TRACE_SAMPLE_RATE,
+    CONF_TRACE_SIZE,
+    CONF_ACTION_WINDOW,
+    CONF_HEDGE_PERCENTILE,
+    DEFAULT_ACTION_WINDOW,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_TRACE_SAMPLE_RATE,
+    DEFAULT_TRACE_SIZE,
+    DEFAULT_IMPORT_CONCURRENCY,
+    DEFAULT_PROFILE_CYCLES,
+    DEFAULT_PROFILE_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Service schemas
 CHECK_IN_SCHEMA = vol.Schema({
     vol.Required("entity_id"): cv.entity_id,
     vol.Optional("latitude"): cv.latitude,
     vol.Optional("longitude"): cv.longitude,
+    vol.Optional("work_check_type"): cv.string,
 })
 
 CHECK_OUT_SCHEMA = vol.Schema({
@@ -36,11 +58,66 @@ CHECK_OUT_SCHEMA = vol.Schema({
     vol.Optional("longitude"): cv.longitude,
 })
 
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional("cycles", default=DEFAULT_PROFILE_CYCLES): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=1000)
+    ),
+    vol.Optional("timeout", default=DEFAULT_PROFILE_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=1)
+    ),
+})
+
+IMPORT_EMPLOYEES_SCHEMA = vol.Schema({
+    vol.Required("path"): cv.string,
+    vol.Optional("concurrency", default=DEFAULT_IMPORT_CONCURRENCY): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=50)
+    ),
+})
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Sesame Time integration."""
+    
+    async def async_import_employees_service(call: ServiceCall) -> ServiceResponse:
+        """Handle import_employees service call."""
+        path = call.data["path"]
+        if not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Access to {path} is not allowed")
+        
+        rows = await hass.async_add_executor_job(load_employee_file, path)
+        return await async_import_employees(hass, rows, call.data["concurrency"])
+    
+    # Available before any employee is configured
+    hass.services.async_register(
+        DOMAIN,
+        "import_employees",
+        async_import_employees_service,
+        schema=IMPORT_EMPLOYEES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sesame Time from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
+    # Sampled request traces, included in the diagnostics download
+    tracer = RequestTracer(
+        size=entry.options.get(CONF_TRACE_SIZE, DEFAULT_TRACE_SIZE),
+        sample_rate=entry.options.get(CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE),
+    )
+    
+    # Work check type catalog shared by all employees of the same company
+    check_types = hass.data.setdefault(DATA_CHECK_TYPES, {}).setdefault(
+        entry.data[CONF_COMPANY_ID], WorkCheckTypeCatalog()
+    )
+    
+    # Closed sessions of the day survive restarts and reloads
+    tracker = WorkTimeTracker(hass, entry.data[CONF_EMPLOYEE_ID])
+    await tracker.async_load()
+    
     # Create API instance for this employee
     session = async_get_clientsession(hass)
     api = SesameTimeAPI(
@@ -49,12 +126,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         token=entry.data[CONF_TOKEN],
         employee_id=entry.data[CONF_EMPLOYEE_ID],
         company_id=entry.data[CONF_COMPANY_ID],
+        tracer=tracer,
+        action_window=entry.options.get(CONF_ACTION_WINDOW, DEFAULT_ACTION_WINDOW),
+        check_types=check_types,
+        hedge_percentile=entry.options.get(CONF_HEDGE_PERCENTILE, DEFAULT_HEDGE_PERCENTILE),
     )
     
     # Store API instance for this entry
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
+        "tracer": tracer,
+        "check_types": check_types,
         "entry_data": entry.data,
+        "tracker": tracker,
     }
     
     # Register services
@@ -63,8 +147,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entity_id = call.data["entity_id"]
         latitude = call.data.get("latitude")
         longitude = call.data.get("longitude")
+        work_check_type = call.data.get("work_check_type")
         
-        _LOGGER.info(f"Service check_in called for {entity_id} with lat={latitude}, lng={longitude}")
+        _LOGGER.info(f"Service check_in called for {entity_id} with lat={latitude}, lng={longitude}, type={work_check_type}")
         
         # Debug: Show all available entries
         _LOGGER.debug(f"Available entries in domain: {list(hass.data[DOMAIN].keys())}")
@@ -81,10 +166,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 if entity_entry:
                     # Check if the unique_id matches this entry's pattern
                     employee_id = data["entry_data"][CONF_EMPLOYEE_ID]
-                    expected_unique_id = f"{employee_id}_check"
-                    _LOGGER.debug(f"Checking entity {entity_id}: unique_id={entity_entry.unique_id}, expected={expected_unique_id}")
+                    # Any button of the employee: check in/out or a work check type
+                    expected_prefix = f"{employee_id}_check"
+                    _LOGGER.debug(f"Checking entity {entity_id}: unique_id={entity_entry.unique_id}, expected prefix={expected_prefix}")
                     
-                    if entity_entry.unique_id == expected_unique_id:
+                    if (
+                        entity_entry.unique_id == expected_prefix
+                        or entity_entry.unique_id.startswith(f"{expected_prefix}_type_")
+                    ):
                         found_api = data["api"]
                         _LOGGER.info(f"Found API for employee ID: {employee_id}")
                         break
@@ -98,7 +187,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         
         if found_api:
             try:
-                result = await found_api.check_in(latitude=latitude, longitude=longitude)
+                result = await found_api.check_in(
+                    latitude=latitude,
+                    longitude=longitude,
+                    work_check_type=work_check_type,
+                )
                 if result.get("success"):
                     _LOGGER.info(f"Check-in successful for {entity_id}")
                 else:
@@ -134,10 +227,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 if entity_entry:
                     # Check if the unique_id matches this entry's pattern
                     employee_id = data["entry_data"][CONF_EMPLOYEE_ID]
-                    expected_unique_id = f"{employee_id}_check"
-                    _LOGGER.debug(f"Checking entity {entity_id}: unique_id={entity_entry.unique_id}, expected={expected_unique_id}")
+                    # Any button of the employee: check in/out or a work check type
+                    expected_prefix = f"{employee_id}_check"
+                    _LOGGER.debug(f"Checking entity {entity_id}: unique_id={entity_entry.unique_id}, expected prefix={expected_prefix}")
                     
-                    if entity_entry.unique_id == expected_unique_id:
+                    if (
+                        entity_entry.unique_id == expected_prefix
+                        or entity_entry.unique_id.startswith(f"{expected_prefix}_type_")
+                    ):
                         found_api = data["api"]
                         _LOGGER.info(f"Found API for employee ID: {employee_id}")
                         break
@@ -164,12 +261,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error(f"Could not find API instance for entity {entity_id}")
             raise HomeAssistantError(f"Could not find API instance for entity {entity_id}")
     
+    async def async_profile_service(call: ServiceCall) -> None:
+        """Handle profile service call."""
+        async_get_profiler(hass).async_start(call.data["cycles"], call.data["timeout"])
+    
+    def profiled(name, handler):
+        """Wrap a service handler so it counts as a profiled cycle."""
+        async def async_handle(call: ServiceCall) -> None:
+            with async_get_profiler(hass).track(CATEGORY_SERVICE, name):
+                await handler(call)
+        return async_handle
+    
     # Register services (only once)
     if not hass.services.has_service(DOMAIN, "check_in"):
         hass.services.async_register(
             DOMAIN,
             "check_in",
-            async_check_in_service,
+            profiled("check_in", async_check_in_service),
             schema=CHECK_IN_SCHEMA,
         )
     
@@ -177,24 +285,59 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_register(
             DOMAIN,
             "check_out",
-            async_check_out_service,
+            profiled("check_out", async_check_out_service),
             schema=CHECK_OUT_SCHEMA,
         )
     
+    if not hass.services.has_service(DOMAIN, "profile"):
+        hass.services.async_register(
+            DOMAIN,
+            "profile",
+            async_profile_service,
+            schema=PROFILE_SCHEMA,
+        )
+    
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    # Reload when options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    # Shared company/area sensors owned by this entry move to another member
+    presence = async_get_presence(hass)
+    presence.async_handover(hass, entry.entry_id)
+    
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        presence.async_restore_sensors()
+        
+        # Drop the company's work check type catalog with its last employee
+        company_id = entry.data[CONF_COMPANY_ID]
+        if not any(
+            data["entry_data"][CONF_COMPANY_ID] == company_id
+            for data in hass.data[DOMAIN].values()
+        ):
+            hass.data.get(DATA_CHECK_TYPES, {}).pop(company_id, None)
         
         # Unregister services if no more entries
         if not hass.data[DOMAIN]:
             hass.services.async_remove(DOMAIN, "check_in")
             hass.services.async_remove(DOMAIN, "check_out")
+            hass.services.async_remove(DOMAIN, "profile")
     
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data stored for a deleted config entry."""
+    await async_remove_work_time(hass, entry.data[CONF_EMPLOYEE_ID])
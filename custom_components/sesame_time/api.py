@@ -1,14 +1,38 @@
 """Sesame Time API client."""
+import asyncio
+from collections import deque
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Awaitable, Callable, Deque, Dict, Any, Iterable, Mapping, Optional, Tuple
 import aiohttp
 import json
 
 try:
-    from .const import DEFAULT_TIMEOUT, USER_AGENT
+    from .const import (
+        CHECK_TYPES_RETRY_INTERVAL,
+        DEFAULT_ACTION_WINDOW,
+        DEFAULT_CHECK_TYPES_TTL,
+        DEFAULT_RATE_LIMIT,
+        DEFAULT_TIMEOUT,
+        HEDGE_LATENCY_WINDOW,
+        HEDGE_MIN_SAMPLES,
+        USER_AGENT,
+    )
+    from .tracing import RequestTracer
 except ImportError:
     # For standalone testing
-    from const import DEFAULT_TIMEOUT, USER_AGENT
+    from const import (
+        CHECK_TYPES_RETRY_INTERVAL,
+        DEFAULT_ACTION_WINDOW,
+        DEFAULT_CHECK_TYPES_TTL,
+        DEFAULT_RATE_LIMIT,
+        DEFAULT_TIMEOUT,
+        HEDGE_LATENCY_WINDOW,
+        HEDGE_MIN_SAMPLES,
+        USER_AGENT,
+    )
+    from tracing import RequestTracer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +47,11 @@ class SesameTimeAPI:
         token: Optional[str] = None,
         employee_id: Optional[str] = None,
         company_id: Optional[str] = None,
+        tracer: Optional[RequestTracer] = None,
+        action_window: float = DEFAULT_ACTION_WINDOW,
+        check_types: Optional["WorkCheckTypeCatalog"] = None,
+        hedge_percentile: Optional[float] = None,
+        rate_limit: int = DEFAULT_RATE_LIMIT,
     ) -> None:
         """Initialize the API client."""
         self._session = session
@@ -30,7 +59,26 @@ class SesameTimeAPI:
         self._token = token
         self._employee_id = employee_id
         self._company_id = company_id
+        self._tracer = tracer
+        # Work check type catalog, usually shared by all employees of a company
+        self._check_types = check_types or WorkCheckTypeCatalog()
+        # Action lane: punches for this employee run one at a time
+        self._action_window = action_window
+        self._action_lock = asyncio.Lock()
+        self._pending_actions: Dict[Tuple[Any, ...], asyncio.Future] = {}
+        # Last successful punch: action, work check type ID, time and result
+        self._last_action: Optional[Tuple[str, Optional[str], float, Dict[str, Any]]] = None
+        # Hedged reads: a second request is sent once the first one is slower
+        # than this percentile of recently observed latencies
+        self._hedge_percentile = hedge_percentile
+        self._read_latencies: Deque[float] = deque(maxlen=HEDGE_LATENCY_WINDOW)
+        # Requests sent in the last minute, hedges must fit in the rate limit
+        self._rate_limit = rate_limit
+        self._request_times: Deque[float] = deque()
         self._base_url = f"https://back-{region}.sesametime.com/api/v3"
+        # Last raw response per endpoint/employee: digest, ETag and parsed result
+        self._response_cache: Dict[str, Dict[str, Any]] = {}
+        self._last_status: Optional[Dict[str, Any]] = None
         
     def _get_headers(self, include_auth: bool = True) -> Dict[str, str]:
         """Get common headers for API requests."""
@@ -57,8 +105,13 @@ class SesameTimeAPI:
             return {"USID": self._token}
         return {}
     
-    async def login(self, email: str, password: str) -> Dict[str, Any]:
-        """Login to Sesame Time and get token."""
+    async def login(self, email: str, password: str, quiet: bool = False) -> Dict[str, Any]:
+        """Login to Sesame Time and get token.
+
+        With ``quiet`` set, failures are logged at debug level, e.g. while
+        probing regions where failing logins are expected.
+        """
+        log_failure = _LOGGER.debug if quiet else _LOGGER.error
         url = f"{self._base_url}/security/login"
         data = {
             "platformData": {
@@ -71,77 +124,389 @@ class SesameTimeAPI:
         }
         
         try:
-            timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+            status, text = await self._post_raw(
+                url,
+                self._get_headers(include_auth=False),
+                {},
+                data,
+                trace_response=False,
+            )
+            if status == 200:
+                result = json.loads(text)
+                self._token = result.get("data")
+                _LOGGER.debug("Login successful")
+                return {"success": True, "token": self._token}
+            else:
+                log_failure(f"Login failed: {status} - {text}")
+                return {"success": False, "error": f"Login failed: {status}"}
+                    
+        except Exception as err:
+            log_failure(f"Login error: {err}")
+            return {"success": False, "error": str(err)}
+    
+    def _trace(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        data: Optional[Dict[str, Any]],
+        status: Optional[int],
+        response_body: Optional[str],
+        started: float,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a sampled exchange in the tracer."""
+        self._tracer.record(
+            method,
+            url,
+            headers,
+            cookies,
+            data,
+            status,
+            response_body,
+            time.monotonic() - started,
+            error,
+        )
+
+    async def _post_raw(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        data: Dict[str, Any],
+        trace_response: bool = True,
+    ) -> Tuple[int, str]:
+        """Perform a POST request and return status and body text."""
+        self._note_request()
+        sampled = self._tracer is not None and self._tracer.sample()
+        started = time.monotonic()
+        timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+        try:
             async with self._session.post(
                 url,
-                headers=self._get_headers(include_auth=False),
+                headers=headers,
+                cookies=cookies,
                 data=json.dumps(data),
                 timeout=timeout,
             ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    self._token = result.get("data")
-                    _LOGGER.debug("Login successful")
-                    return {"success": True, "token": self._token}
-                else:
-                    text = await response.text()
-                    _LOGGER.error(f"Login failed: {response.status} - {text}")
-                    return {"success": False, "error": f"Login failed: {response.status}"}
-                    
+                text = await response.text()
         except Exception as err:
-            _LOGGER.error(f"Login error: {err}")
-            return {"success": False, "error": str(err)}
-    
+            if sampled:
+                self._trace("POST", url, headers, cookies, data, None, None, started, str(err))
+            raise
+        if sampled:
+            self._trace(
+                "POST",
+                url,
+                headers,
+                cookies,
+                data,
+                response.status,
+                text if trace_response else None,
+                started,
+            )
+        return response.status, text
+
+    def _cache_key(self, endpoint: str) -> str:
+        """Return the response cache key for an endpoint and the current employee."""
+        return f"{endpoint}:{self._employee_id}"
+
+    async def _get_raw(
+        self, url: str, headers: Dict[str, str], cookies: Dict[str, str]
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Perform a GET request and return status, headers and raw body.
+
+        Headers keep aiohttp's case-insensitive mapping, proxies often
+        lowercase header names.
+        """
+        self._note_request()
+        sampled = self._tracer is not None and self._tracer.sample()
+        started = time.monotonic()
+        timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+        try:
+            async with self._session.get(
+                url,
+                headers=headers,
+                cookies=cookies,
+                timeout=timeout,
+            ) as response:
+                body = await response.read()
+        except Exception as err:
+            if sampled:
+                self._trace("GET", url, headers, cookies, None, None, None, started, str(err))
+            raise
+        if sampled:
+            self._trace(
+                "GET",
+                url,
+                headers,
+                cookies,
+                None,
+                response.status,
+                body.decode(errors="replace"),
+                started,
+            )
+        return response.status, response.headers, body
+
+    def _prune_request_times(self) -> None:
+        """Forget requests older than the rate limit window."""
+        cutoff = time.monotonic() - 60
+        while self._request_times and self._request_times[0] < cutoff:
+            self._request_times.popleft()
+
+    def _note_request(self) -> None:
+        """Count a request against the rate limit."""
+        self._prune_request_times()
+        self._request_times.append(time.monotonic())
+
+    def _has_request_budget(self) -> bool:
+        """Return True if one more request fits in the per-minute rate limit."""
+        self._prune_request_times()
+        return len(self._request_times) < self._rate_limit
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Return how long to wait before hedging a read, None to not hedge."""
+        if not self._hedge_percentile or len(self._read_latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        latencies = sorted(self._read_latencies)
+        index = round(self._hedge_percentile / 100 * (len(latencies) - 1))
+        return latencies[index]
+
+    async def _get_read(
+        self, url: str, headers: Dict[str, str], cookies: Dict[str, str]
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Perform an idempotent GET, hedging it when it is slow.
+
+        If the request has not finished after the configured latency
+        percentile, and the rate limit allows it, an identical request is
+        sent and whichever finishes first wins; the other one is cancelled.
+        Only reads may use this, writes are never hedged.
+        """
+        started = time.monotonic()
+        delay = self._hedge_delay()
+        if delay is None:
+            result = await self._get_raw(url, headers, cookies)
+            self._read_latencies.append(time.monotonic() - started)
+            return result
+        
+        pending = {asyncio.create_task(self._get_raw(url, headers, cookies))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done and self._has_request_budget():
+                _LOGGER.debug(f"Hedging read of {url} after {delay:.3f}s")
+                pending.add(asyncio.create_task(self._get_raw(url, headers, cookies)))
+            
+            error: Optional[BaseException] = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        self._read_latencies.append(time.monotonic() - started)
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def get_me(self) -> Dict[str, Any]:
-        """Get current user information."""
+        """Get current user information.
+
+        The digest of the last raw body is kept per endpoint and employee, and
+        the ETag is sent back as If-None-Match when the backend provides one.
+        When the response is unchanged the cached result is returned with
+        ``unchanged`` set, skipping JSON decoding and result building.
+        """
         if not self._token:
             return {"success": False, "error": "Not authenticated"}
             
         url = f"{self._base_url}/security/me"
+        cache_key = self._cache_key("security/me")
+        cached = self._response_cache.get(cache_key)
         
         try:
-            timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-            
             # First try without auth headers
-            cookies = self._get_cookies()
-            async with self._session.get(
-                url,
-                headers=self._get_headers(include_auth=False),
-                cookies=cookies,
-                timeout=timeout,
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    data = result.get("data", [])
-                    if data and len(data) > 0:
-                        user_data = data[0]
-                        self._employee_id = user_data.get("id")
-                        self._company_id = user_data.get("companyId")
-                        
-                        return {
-                            "success": True,
-                            "employee_id": self._employee_id,
-                            "company_id": self._company_id,
-                            "employee_name": f"{user_data.get('firstName', '')} {user_data.get('lastName', '')}".strip(),
-                            "company_name": user_data.get("companyName"),
-                            "last_check": user_data.get("lastCheck"),
-                            "work_status": user_data.get("workStatus"),
-                        }
-                else:
-                    text = await response.text()
-                    _LOGGER.error(f"Get me failed: {response.status} - {text}")
-                    return {"success": False, "error": f"Get me failed: {response.status}"}
+            headers = self._get_headers(include_auth=False)
+            if cached and cached.get("etag"):
+                headers["if-none-match"] = cached["etag"]
+            
+            status, response_headers, body = await self._get_read(
+                url, headers, self._get_cookies()
+            )
+            
+            if status == 304 and cached:
+                return {**cached["result"], "unchanged": True}
+            
+            if status == 200:
+                digest = hashlib.blake2b(body, digest_size=16).digest()
+                if cached and cached["digest"] == digest:
+                    return {**cached["result"], "unchanged": True}
+                
+                result = json.loads(body)
+                data = result.get("data", [])
+                if data and len(data) > 0:
+                    user_data = data[0]
+                    self._employee_id = user_data.get("id")
+                    self._company_id = user_data.get("companyId")
+                    
+                    me = {
+                        "success": True,
+                        "employee_id": self._employee_id,
+                        "company_id": self._company_id,
+                        "employee_name": f"{user_data.get('firstName', '')} {user_data.get('lastName', '')}".strip(),
+                        "company_name": user_data.get("companyName"),
+                        "last_check": user_data.get("lastCheck"),
+                        "work_status": user_data.get("workStatus"),
+                    }
+                    self._response_cache[self._cache_key("security/me")] = {
+                        "digest": digest,
+                        "etag": response_headers.get("ETag"),
+                        "result": me,
+                    }
+                    return me
+                return {"success": False, "error": "Get me returned no data"}
+            else:
+                text = body.decode(errors="replace")
+                _LOGGER.error(f"Get me failed: {status} - {text}")
+                return {"success": False, "error": f"Get me failed: {status}"}
                     
         except Exception as err:
             _LOGGER.error(f"Get me error: {err}")
             return {"success": False, "error": str(err)}
     
-    async def check_in(self, latitude: Optional[float] = None, longitude: Optional[float] = None) -> Dict[str, Any]:
-        """Perform check-in."""
+    async def check_in(
+        self,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        work_check_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Perform check-in, optionally with a work check type such as a break."""
+        work_check_type_id = None
+        if work_check_type is not None:
+            # Resolved locally from the cached catalog, no request per punch
+            resolved = await self._check_types.async_resolve(self, work_check_type)
+            if not resolved.get("success"):
+                return resolved
+            work_check_type_id = resolved["id"]
+        
+        return await self._run_action(
+            ("check-in", latitude, longitude, work_check_type_id),
+            "check-in",
+            work_check_type_id,
+            lambda: self._punch("check-in", latitude, longitude, work_check_type_id),
+        )
+    
+    async def check_out(self, latitude: Optional[float] = None, longitude: Optional[float] = None) -> Dict[str, Any]:
+        """Perform check-out."""
+        return await self._run_action(
+            ("check-out", latitude, longitude, None),
+            "check-out",
+            None,
+            lambda: self._punch("check-out", latitude, longitude),
+        )
+    
+    async def toggle(self) -> Dict[str, Any]:
+        """Check in or out depending on the current status.
+
+        The status read and the punch run inside the action lane, so a
+        concurrent press or service call cannot act on a stale status. A
+        toggle arriving within the action window of any successful punch is
+        dropped, since it was decided on the status before that punch.
+        """
+        return await self._run_action(("toggle",), "toggle", None, self._toggle)
+    
+    async def _toggle(self) -> Dict[str, Any]:
+        """Read the current status and send the opposite punch."""
+        status_result = await self.get_status()
+        if not status_result.get("success"):
+            return {
+                "success": False,
+                "error": f"Failed to get status: {status_result.get('error')}",
+            }
+        action = "check-out" if status_result.get("is_checked_in") else "check-in"
+        result = await self._punch(action, None, None)
+        return {**result, "action": action}
+    
+    def _is_redundant(self, action: str, work_check_type_id: Optional[str]) -> bool:
+        """Return True if an action repeats the last punch within the action window."""
+        last = self._last_action
+        if last is None or time.monotonic() - last[2] >= self._action_window:
+            return False
+        if action == "toggle":
+            return True
+        return (action, work_check_type_id) == (last[0], last[1])
+    
+    async def _run_action(
+        self,
+        key: Tuple[Any, ...],
+        action: str,
+        work_check_type_id: Optional[str],
+        func: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Run a punch in this employee's action lane.
+
+        Pending actions with the same key (action, coordinates and type)
+        share a single request, and an action that repeats the last
+        successful punch within the action window is dropped and returns the
+        previous result with ``deduplicated`` set. Merged callers see the
+        error of a failed request; if the caller that started it is
+        cancelled, they run the action again instead.
+        """
+        pending = self._pending_actions.get(key)
+        while pending is not None:
+            _LOGGER.debug(f"Merging {action} with the pending identical action")
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                _LOGGER.debug(f"Pending {action} was cancelled, running it again")
+                pending = self._pending_actions.get(key)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending_actions[key] = future
+        try:
+            async with self._action_lock:
+                if self._is_redundant(action, work_check_type_id):
+                    _LOGGER.info(f"Dropping redundant {action} within {self._action_window}s of the last {self._last_action[0]}")
+                    result = {**self._last_action[3], "deduplicated": True}
+                else:
+                    result = await func()
+                    if result.get("success"):
+                        self._last_action = (
+                            result.get("action", action),
+                            work_check_type_id,
+                            time.monotonic(),
+                            result,
+                        )
+            future.set_result(result)
+            return result
+        except Exception as err:
+            future.set_exception(err)
+            # Mark it retrieved, nobody may have merged onto this action
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._pending_actions[key]
+    
+    async def _punch(
+        self,
+        action: str,
+        latitude: Optional[float],
+        longitude: Optional[float],
+        work_check_type_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send a check-in or check-out punch."""
+        label = action.capitalize()
         if not all([self._token, self._employee_id, self._company_id]):
             return {"success": False, "error": "Missing authentication data"}
             
-        url = f"{self._base_url}/employees/{self._employee_id}/check-in"
+        url = f"{self._base_url}/employees/{self._employee_id}/{action}"
         
         # Build coordinates object
         coordinates = {}
@@ -154,96 +519,221 @@ class SesameTimeAPI:
         data = {
             "origin": "web_extension",
             "coordinates": coordinates,
-            "workCheckTypeId": None
+            "workCheckTypeId": work_check_type_id
         }
         
         try:
-            timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-            cookies = self._get_cookies()
-            
-            _LOGGER.debug(f"Check-in URL: {url}")
-            _LOGGER.debug(f"Check-in data: {json.dumps(data)}")
-            _LOGGER.debug(f"Check-in headers: {self._get_headers()}")
-            
-            async with self._session.post(
+            status, text = await self._post_raw(
                 url,
-                headers=self._get_headers(),
-                cookies=cookies,
-                data=json.dumps(data),
-                timeout=timeout,
-            ) as response:
-                response_text = await response.text()
-                _LOGGER.debug(f"Check-in response status: {response.status}")
-                _LOGGER.debug(f"Check-in response: {response_text}")
-                
-                if response.status == 200:
-                    _LOGGER.info("Check-in successful")
-                    return {"success": True}
-                else:
-                    _LOGGER.error(f"Check-in failed: {response.status} - {response_text}")
-                    return {"success": False, "error": f"Check-in failed: {response.status}"}
+                self._get_headers(),
+                self._get_cookies(),
+                data,
+            )
+            if status == 200:
+                _LOGGER.info(f"{label} successful")
+                return {"success": True}
+            else:
+                _LOGGER.error(f"{label} failed: {status} - {text}")
+                return {"success": False, "error": f"{label} failed: {status}"}
                     
         except Exception as err:
-            _LOGGER.error(f"Check-in error: {err}")
+            _LOGGER.error(f"{label} error: {err}")
             return {"success": False, "error": str(err)}
     
-    async def check_out(self, latitude: Optional[float] = None, longitude: Optional[float] = None) -> Dict[str, Any]:
-        """Perform check-out."""
+    async def get_checks(self, from_date: str, to_date: str) -> Dict[str, Any]:
+        """Get the employee's checks between two ISO dates, both included."""
         if not all([self._token, self._employee_id, self._company_id]):
             return {"success": False, "error": "Missing authentication data"}
-            
-        url = f"{self._base_url}/employees/{self._employee_id}/check-out"
         
-        # Build coordinates object
-        coordinates = {}
-        if latitude is not None and longitude is not None:
-            coordinates = {
-                "latitude": latitude,
-                "longitude": longitude
-            }
+        url = f"{self._base_url}/employees/{self._employee_id}/checks?from={from_date}&to={to_date}"
         
-        data = {
-            "origin": "web_extension",
-            "coordinates": coordinates,
-            "workCheckTypeId": None
-        }
+        try:
+            status, _headers, body = await self._get_raw(
+                url, self._get_headers(), self._get_cookies()
+            )
+            if status == 200:
+                result = json.loads(body)
+                return {
+                    "success": True,
+                    "checks": [
+                        {
+                            "check_in": item.get("checkInDatetime"),
+                            "check_out": item.get("checkOutDatetime"),
+                            "work_check_type_id": item.get("workCheckTypeId"),
+                        }
+                        for item in result.get("data", [])
+                    ],
+                }
+            else:
+                _LOGGER.error(f"Get checks failed: {status} - {body.decode(errors='replace')}")
+                return {"success": False, "error": f"Get checks failed: {status}"}
+        
+        except Exception as err:
+            _LOGGER.error(f"Get checks error: {err}")
+            return {"success": False, "error": str(err)}
+    
+    async def get_work_check_types(self) -> Dict[str, Any]:
+        """Get the company's work check types (breaks, pauses, ...)."""
+        if not all([self._token, self._company_id]):
+            return {"success": False, "error": "Missing authentication data"}
+        
+        url = f"{self._base_url}/companies/{self._company_id}/work-check-types"
         
         try:
-            timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-            cookies = self._get_cookies()
-            
-            async with self._session.post(
-                url,
-                headers=self._get_headers(),
-                cookies=cookies,
-                data=json.dumps(data),
-                timeout=timeout,
-            ) as response:
-                if response.status == 200:
-                    _LOGGER.info("Check-out successful")
-                    return {"success": True}
-                else:
-                    text = await response.text()
-                    _LOGGER.error(f"Check-out failed: {response.status} - {text}")
-                    return {"success": False, "error": f"Check-out failed: {response.status}"}
-                    
+            status, _headers, body = await self._get_raw(
+                url, self._get_headers(), self._get_cookies()
+            )
+            if status == 200:
+                result = json.loads(body)
+                return {
+                    "success": True,
+                    "types": [
+                        {"id": item.get("id"), "name": item.get("name")}
+                        for item in result.get("data", [])
+                        if item.get("id") and item.get("name")
+                    ],
+                }
+            else:
+                _LOGGER.error(f"Get work check types failed: {status} - {body.decode(errors='replace')}")
+                return {"success": False, "error": f"Get work check types failed: {status}"}
+        
         except Exception as err:
-            _LOGGER.error(f"Check-out error: {err}")
+            _LOGGER.error(f"Get work check types error: {err}")
             return {"success": False, "error": str(err)}
     
     async def get_status(self) -> Dict[str, Any]:
-        """Get current check-in status."""
+        """Get current check-in status.
+
+        An unchanged ``/security/me`` response returns the previous status
+        with ``unchanged`` set so callers can skip their own updates.
+        """
         result = await self.get_me()
+        if result.get("unchanged") and self._last_status is not None:
+            return {**self._last_status, "unchanged": True}
         if result.get("success"):
             last_check = result.get("last_check", {})
             if last_check:
                 has_check_out = last_check.get("checkOutDatetime") is not None
-                return {
+                self._last_status = {
                     "success": True,
                     "is_checked_in": not has_check_out,
                     "last_check_in": last_check.get("checkInDatetime"),
                     "last_check_out": last_check.get("checkOutDatetime"),
                     "work_status": result.get("work_status"),
+                    "employee_name": result.get("employee_name"),
                 }
+                return self._last_status
         
-        return result
\ No newline at end of file
+        return result
+
+
+class WorkCheckTypeCatalog:
+    """TTL cache of a company's work check types.
+
+    One catalog is shared by every employee of the same company, and
+    concurrent misses wait for a single fetch. A failed fetch is not
+    retried for ``retry_interval`` seconds, and a stale catalog keeps being
+    served meanwhile, so an outage does not cost one request per punch.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CHECK_TYPES_TTL,
+        retry_interval: float = CHECK_TYPES_RETRY_INTERVAL,
+    ) -> None:
+        """Initialize the catalog."""
+        self._ttl = ttl
+        self._retry_interval = retry_interval
+        self._lock = asyncio.Lock()
+        self._types: Optional[Dict[str, Dict[str, str]]] = None
+        self._fetched = 0.0
+        self._retry_after = 0.0
+        self._error: Optional[str] = None
+
+    def _needs_fetch(self) -> bool:
+        """Return True if the catalog is stale and no failed fetch is backing off."""
+        now = time.monotonic()
+        if self._types is not None and now - self._fetched < self._ttl:
+            return False
+        return now >= self._retry_after
+
+    async def async_get(self, api: SesameTimeAPI) -> Dict[str, Any]:
+        """Return the catalog, fetching it through api when stale."""
+        if self._needs_fetch():
+            async with self._lock:
+                if self._needs_fetch():
+                    result = await api.get_work_check_types()
+                    if result.get("success"):
+                        # Names are matched case-insensitively
+                        self._types = {
+                            item["name"].casefold(): item for item in result["types"]
+                        }
+                        self._fetched = time.monotonic()
+                        self._error = None
+                    else:
+                        self._retry_after = time.monotonic() + self._retry_interval
+                        self._error = result.get("error")
+                        if self._types is not None:
+                            _LOGGER.warning(
+                                f"Refreshing work check types failed, using the previous catalog: {self._error}"
+                            )
+        if self._types is None:
+            return {"success": False, "error": self._error or "Work check types unavailable"}
+        return {"success": True, "types": list(self._types.values())}
+
+    async def async_resolve(self, api: SesameTimeAPI, name: str) -> Dict[str, Any]:
+        """Resolve a work check type name to its ID."""
+        result = await self.async_get(api)
+        if not result.get("success"):
+            return result
+        item = self._types.get(name.strip().casefold())
+        if item is None:
+            valid = ", ".join(sorted(item["name"] for item in self._types.values()))
+            return {"success": False, "error": f"Unknown work check type '{name}', valid types: {valid}"}
+        return {"success": True, "id": item["id"], "name": item["name"]}
+
+
+async def probe_regions(
+    session: aiohttp.ClientSession,
+    email: str,
+    password: str,
+    regions: Iterable[str],
+) -> Dict[str, Any]:
+    """Log in against all regions concurrently and keep the first that succeeds.
+
+    Attempts still running once a region succeeds are cancelled. The measured
+    login latency in milliseconds is returned for every region that answered.
+    """
+    async def attempt(region: str) -> Tuple[str, Dict[str, Any], float]:
+        api = SesameTimeAPI(session, region)
+        started = time.monotonic()
+        result = await api.login(email, password, quiet=True)
+        return region, result, time.monotonic() - started
+    
+    pending = {asyncio.create_task(attempt(region)) for region in regions}
+    latency: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
+    winner: Optional[Tuple[str, Dict[str, Any]]] = None
+    
+    try:
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                region, result, elapsed = task.result()
+                latency[region] = round(elapsed * 1000, 1)
+                if result.get("success") and winner is None:
+                    winner = (region, result)
+                elif not result.get("success"):
+                    errors[region] = result.get("error")
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    _LOGGER.debug(f"Region probe latency (ms): {latency}")
+    if winner is None:
+        return {"success": False, "error": f"Login failed in all regions: {errors}", "latency": latency}
+    
+    region, result = winner
+    return {"success": True, "region": region, "token": result.get("token"), "latency": latency}
@@ -1,10 +1,12 @@
 """Button platform for Sesame Time integration."""
+from datetime import timedelta
 import logging
 from typing import Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.exceptions import HomeAssistantError
@@ -14,7 +16,10 @@ from .const import (
     CONF_EMPLOYEE_ID,
     CONF_EMPLOYEE_NAME,
     CONF_COMPANY_NAME,
+    CHECK_TYPES_RETRY_INTERVAL,
+    DEFAULT_CHECK_TYPES_TTL,
 )
+from .profiler import CATEGORY_SERVICE, async_get_profiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +43,53 @@ async def async_setup_entry(
     ]
     
     async_add_entities(entities)
+    
+    # Work check type IDs that already have a button
+    added_types = set()
+    
+    async def async_add_check_type_buttons() -> None:
+        """Add one check-in button per new work check type (breaks, pauses, ...)."""
+        catalog = await data["check_types"].async_get(api)
+        if not catalog.get("success"):
+            _LOGGER.warning(
+                f"Work check types unavailable, retrying in {CHECK_TYPES_RETRY_INTERVAL}s: {catalog.get('error')}"
+            )
+            config_entry.async_on_unload(
+                async_call_later(hass, CHECK_TYPES_RETRY_INTERVAL, schedule_check_type_buttons)
+            )
+            return
+        
+        new_types = [
+            work_check_type
+            for work_check_type in catalog["types"]
+            if work_check_type["id"] not in added_types
+        ]
+        added_types.update(work_check_type["id"] for work_check_type in new_types)
+        async_add_entities(
+            SesameTimeCheckTypeButton(
+                api=api,
+                entry_data=entry_data,
+                work_check_type=work_check_type,
+            )
+            for work_check_type in new_types
+        )
+    
+    @callback
+    def schedule_check_type_buttons(_now=None) -> None:
+        """Fetch the catalog in the background so setup never waits on it."""
+        config_entry.async_create_background_task(
+            hass,
+            async_add_check_type_buttons(),
+            f"{DOMAIN} work check type buttons",
+        )
+    
+    schedule_check_type_buttons()
+    # Types added to the company later get their button once the catalog refreshes
+    config_entry.async_on_unload(
+        async_track_time_interval(
+            hass, schedule_check_type_buttons, timedelta(seconds=DEFAULT_CHECK_TYPES_TTL)
+        )
+    )
 
 
 class SesameTimeCheckButton(ButtonEntity):
@@ -71,24 +123,19 @@ class SesameTimeCheckButton(ButtonEntity):
     
     async def async_press(self) -> None:
         """Handle the button press."""
+        with async_get_profiler(self.hass).track(CATEGORY_SERVICE, "button_press"):
+            await self._async_toggle()
+    
+    async def _async_toggle(self) -> None:
+        """Check in or out depending on the current status."""
         try:
-            # Get current status
-            status_result = await self._api.get_status()
-            
-            if not status_result.get("success"):
-                raise HomeAssistantError(f"Failed to get status: {status_result.get('error')}")
+            # Status read and punch run serialized in the employee's action lane
+            result = await self._api.toggle()
+            action = result.get("action", "check action")
             
-            # Decide action based on current status
-            if status_result.get("is_checked_in"):
-                # Currently checked in, so check out
-                result = await self._api.check_out()
-                action = "check-out"
-            else:
-                # Currently checked out, so check in
-                result = await self._api.check_in()
-                action = "check-in"
-            
-            if result.get("success"):
+            if result.get("deduplicated"):
+                _LOGGER.info(f"Ignored repeated press for {self._entry_data[CONF_EMPLOYEE_NAME]}")
+            elif result.get("success"):
                 _LOGGER.info(f"Successfully performed {action} for {self._entry_data[CONF_EMPLOYEE_NAME]}")
                 
                 # Update the sensor
@@ -103,4 +150,43 @@ class SesameTimeCheckButton(ButtonEntity):
                 
         except Exception as err:
             _LOGGER.error(f"Error performing check action: {err}")
-            raise HomeAssistantError(f"Error: {err}")
\ No newline at end of file
+            raise HomeAssistantError(f"Error: {err}")
+
+
+class SesameTimeCheckTypeButton(ButtonEntity):
+    """Sesame Time check-in button for a work check type."""
+
+    def __init__(self, api, entry_data, work_check_type):
+        """Initialize the button."""
+        self._api = api
+        self._entry_data = entry_data
+        self._work_check_type = work_check_type["name"]
+        
+        # Entity attributes
+        employee_name = entry_data[CONF_EMPLOYEE_NAME]
+        company_name = entry_data[CONF_COMPANY_NAME]
+        employee_id = entry_data[CONF_EMPLOYEE_ID]
+        
+        self._attr_name = f"{employee_name} Check In {self._work_check_type}"
+        self._attr_unique_id = f"{employee_id}_check_type_{work_check_type['id']}"
+        self._attr_icon = "mdi:coffee-outline"
+        
+        # Device info
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, employee_id)},
+            name=f"{employee_name} ({company_name})",
+            manufacturer="Sesame Time",
+            model="Employee",
+            sw_version="1.0",
+        )
+    
+    async def async_press(self) -> None:
+        """Handle the button press."""
+        with async_get_profiler(self.hass).track(CATEGORY_SERVICE, "button_press"):
+            result = await self._api.check_in(work_check_type=self._work_check_type)
+        
+        if not result.get("success"):
+            _LOGGER.error(f"Error performing {self._work_check_type} check-in: {result.get('error')}")
+            raise HomeAssistantError(f"Failed to check in {self._work_check_type}: {result.get('error')}")
+        
+        _LOGGER.info(f"Successfully checked in {self._work_check_type} for {self._entry_data[CONF_EMPLOYEE_NAME]}")
@@ -5,20 +5,30 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import SesameTimeAPI
+from .api import SesameTimeAPI, probe_regions
 from .const import (
     DOMAIN,
     REGIONS,
+    REGION_AUTO,
     CONF_REGION,
+    CONF_REGION_LATENCY,
     CONF_TOKEN,
     CONF_EMPLOYEE_ID,
     CONF_COMPANY_ID,
     CONF_EMPLOYEE_NAME,
     CONF_COMPANY_NAME,
+    CONF_TRACE_SAMPLE_RATE,
+    CONF_TRACE_SIZE,
+    CONF_ACTION_WINDOW,
+    CONF_HEDGE_PERCENTILE,
+    DEFAULT_ACTION_WINDOW,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_TRACE_SAMPLE_RATE,
+    DEFAULT_TRACE_SIZE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,12 +37,28 @@ _LOGGER = logging.getLogger(__name__)
 async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate the user input allows us to connect."""
     session = async_get_clientsession(hass)
-    api = SesameTimeAPI(session, data[CONF_REGION])
+    region = data[CONF_REGION]
+    region_latency = None
     
-    # Login
-    login_result = await api.login(data[CONF_EMAIL], data[CONF_PASSWORD])
-    if not login_result.get("success"):
-        raise ValueError(login_result.get("error", "Login failed"))
+    if region == REGION_AUTO:
+        # Race a login against every region and keep the first one that works
+        probe_result = await probe_regions(
+            session, data[CONF_EMAIL], data[CONF_PASSWORD], REGIONS
+        )
+        if not probe_result.get("success"):
+            raise ValueError(probe_result.get("error", "Login failed"))
+        region = probe_result["region"]
+        region_latency = probe_result["latency"]
+        _LOGGER.info(f"Detected region {region}, login latency (ms): {region_latency}")
+        api = SesameTimeAPI(session, region, token=probe_result["token"])
+        login_result = probe_result
+    else:
+        api = SesameTimeAPI(session, region)
+        
+        # Login
+        login_result = await api.login(data[CONF_EMAIL], data[CONF_PASSWORD])
+        if not login_result.get("success"):
+            raise ValueError(login_result.get("error", "Login failed"))
     
     # Get user info
     user_result = await api.get_me()
@@ -40,6 +66,8 @@ async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str,
         raise ValueError(user_result.get("error", "Failed to get user info"))
     
     return {
+        CONF_REGION: region,
+        CONF_REGION_LATENCY: region_latency,
         CONF_TOKEN: login_result.get("token"),
         CONF_EMPLOYEE_ID: user_result.get("employee_id"),
         CONF_COMPANY_ID: user_result.get("company_id"),
@@ -53,6 +81,46 @@ class SesameTimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return SesameTimeOptionsFlow(config_entry)
+
+    async def _async_create_entry_from_info(
+        self, email: str, info: Dict[str, Any]
+    ) -> FlowResult:
+        """Create the config entry for a validated employee."""
+        # Create unique ID based on employee ID
+        await self.async_set_unique_id(info[CONF_EMPLOYEE_ID])
+        self._abort_if_unique_id_configured()
+        
+        # Store all necessary data
+        data = {
+            CONF_REGION: info[CONF_REGION],
+            CONF_EMAIL: email,
+            CONF_TOKEN: info[CONF_TOKEN],
+            CONF_EMPLOYEE_ID: info[CONF_EMPLOYEE_ID],
+            CONF_COMPANY_ID: info[CONF_COMPANY_ID],
+            CONF_EMPLOYEE_NAME: info[CONF_EMPLOYEE_NAME],
+            CONF_COMPANY_NAME: info[CONF_COMPANY_NAME],
+        }
+        if info.get(CONF_REGION_LATENCY):
+            data[CONF_REGION_LATENCY] = info[CONF_REGION_LATENCY]
+        
+        # Title will be "Employee Name - Company Name"
+        title = f"{info[CONF_EMPLOYEE_NAME]} - {info[CONF_COMPANY_NAME]}"
+        
+        return self.async_create_entry(title=title, data=data)
+
+    async def async_step_import(self, import_data: Dict[str, Any]) -> FlowResult:
+        """Create an entry for an employee already validated by the bulk import."""
+        return await self._async_create_entry_from_info(
+            import_data[CONF_EMAIL], import_data
+        )
+
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -63,25 +131,9 @@ class SesameTimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 info = await validate_input(self.hass, user_input)
                 
-                # Create unique ID based on employee ID
-                await self.async_set_unique_id(info[CONF_EMPLOYEE_ID])
-                self._abort_if_unique_id_configured()
-                
-                # Store all necessary data
-                data = {
-                    CONF_REGION: user_input[CONF_REGION],
-                    CONF_EMAIL: user_input[CONF_EMAIL],
-                    CONF_TOKEN: info[CONF_TOKEN],
-                    CONF_EMPLOYEE_ID: info[CONF_EMPLOYEE_ID],
-                    CONF_COMPANY_ID: info[CONF_COMPANY_ID],
-                    CONF_EMPLOYEE_NAME: info[CONF_EMPLOYEE_NAME],
-                    CONF_COMPANY_NAME: info[CONF_COMPANY_NAME],
-                }
-                
-                # Title will be "Employee Name - Company Name"
-                title = f"{info[CONF_EMPLOYEE_NAME]} - {info[CONF_COMPANY_NAME]}"
-                
-                return self.async_create_entry(title=title, data=data)
+                return await self._async_create_entry_from_info(
+                    user_input[CONF_EMAIL], info
+                )
                 
             except ValueError as err:
                 errors["base"] = "auth_failed"
@@ -92,7 +144,9 @@ class SesameTimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         
         # Show form
         data_schema = vol.Schema({
-            vol.Required(CONF_REGION, default="eu1"): vol.In(REGIONS),
+            vol.Required(CONF_REGION, default=REGION_AUTO): vol.In(
+                {REGION_AUTO: "Auto-detect", **REGIONS}
+            ),
             vol.Required(CONF_EMAIL): str,
             vol.Required(CONF_PASSWORD): str,
         })
@@ -101,4 +155,44 @@ class SesameTimeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user",
             data_schema=data_schema,
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+
+class SesameTimeOptionsFlow(config_entries.OptionsFlow):
+    """Handle Sesame Time options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+        
+        options = self._entry.options
+        data_schema = vol.Schema({
+            vol.Required(
+                CONF_ACTION_WINDOW,
+                default=options.get(CONF_ACTION_WINDOW, DEFAULT_ACTION_WINDOW),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+            vol.Required(
+                CONF_HEDGE_PERCENTILE,
+                default=options.get(CONF_HEDGE_PERCENTILE, DEFAULT_HEDGE_PERCENTILE),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=99.9)),
+            vol.Required(
+                CONF_TRACE_SAMPLE_RATE,
+                default=options.get(CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+            vol.Required(
+                CONF_TRACE_SIZE,
+                default=options.get(CONF_TRACE_SIZE, DEFAULT_TRACE_SIZE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+        })
+        
+        return self.async_show_form(
+            step_id="init",
+            data_schema=data_schema,
+        )
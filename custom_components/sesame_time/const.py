@@ -1,7 +1,14 @@
 """Constants for the Sesame Time integration."""
+from datetime import timedelta
 
 DOMAIN = "sesame_time"
 
+# Shared data keys
+DATA_TICKER = f"{DOMAIN}_ticker"
+DATA_PROFILER = f"{DOMAIN}_profiler"
+DATA_PRESENCE = f"{DOMAIN}_presence"
+DATA_CHECK_TYPES = f"{DOMAIN}_check_types"
+
 # Configuration
 CONF_REGION = "region"
 CONF_TOKEN = "token"
@@ -9,12 +16,49 @@ CONF_EMPLOYEE_ID = "employee_id"
 CONF_COMPANY_ID = "company_id"
 CONF_EMPLOYEE_NAME = "employee_name"
 CONF_COMPANY_NAME = "company_name"
+CONF_REGION_LATENCY = "region_latency"
+
+# Options
+CONF_TRACE_SAMPLE_RATE = "trace_sample_rate"
+CONF_TRACE_SIZE = "trace_size"
+CONF_ACTION_WINDOW = "action_window"
+CONF_HEDGE_PERCENTILE = "hedge_percentile"
 
 # API
 DEFAULT_TIMEOUT = 30
 USER_AGENT = "Home Assistant Sesame Time Integration"
 
+# Requests per minute and employee, hedged reads only go out within it
+DEFAULT_RATE_LIMIT = 30
+
+# Hedged reads (0 disables hedging)
+DEFAULT_HEDGE_PERCENTILE = 0
+HEDGE_LATENCY_WINDOW = 50
+HEDGE_MIN_SAMPLES = 10
+
+# Work check type catalog cache lifetime (seconds)
+DEFAULT_CHECK_TYPES_TTL = 3600
+CHECK_TYPES_RETRY_INTERVAL = 300
+
+# Punches repeating the last one within this many seconds are dropped
+DEFAULT_ACTION_WINDOW = 5.0
+
+# Request tracing
+DEFAULT_TRACE_SAMPLE_RATE = 0.0
+DEFAULT_TRACE_SIZE = 50
+
+# Bulk import
+DEFAULT_IMPORT_CONCURRENCY = 10
+
+# Profiling
+DEFAULT_PROFILE_CYCLES = 10
+DEFAULT_PROFILE_TIMEOUT = 600
+
+# Work time
+WORK_TIME_TICK_INTERVAL = timedelta(minutes=1)
+
 # Regions
+REGION_AUTO = "auto"
 REGIONS = {
     "eu1": "Europe",
     "us1": "United States",
@@ -30,4 +74,7 @@ ATTR_LAST_CHECK_IN = "last_check_in"
 ATTR_LAST_CHECK_OUT = "last_check_out"
 ATTR_EMPLOYEE_NAME = "employee_name"
 ATTR_COMPANY_NAME = "company_name"
-ATTR_WORK_STATUS = "work_status"
\ No newline at end of file
+ATTR_WORK_STATUS = "work_status"
+ATTR_CHECKED_IN = "checked_in"
+ATTR_CHECKED_OUT = "checked_out"
+ATTR_PRESENT = "present"
@@ -0,0 +1,103 @@
+"""Bulk employee import for Sesame Time."""
+import asyncio
+import csv
+import logging
+import os
+from typing import Any, Dict, List
+
+import voluptuous as vol
+import yaml
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.exceptions import HomeAssistantError
+
+from .config_flow import validate_input
+from .const import DOMAIN, REGIONS, REGION_AUTO, CONF_REGION
+
+_LOGGER = logging.getLogger(__name__)
+
+ROW_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_EMAIL): vol.All(str, vol.Strip, vol.Length(min=1)),
+        vol.Required(CONF_PASSWORD): vol.All(str, vol.Length(min=1)),
+        vol.Optional(CONF_REGION, default=REGION_AUTO): vol.All(
+            str, vol.Strip, vol.Lower, vol.In([REGION_AUTO, *REGIONS])
+        ),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
+def load_employee_file(path: str) -> List[Dict[str, Any]]:
+    """Read employee credentials from a CSV or YAML file.
+
+    CSV files need a header row with ``email``, ``password`` and optionally
+    ``region`` columns. YAML files contain a list of mappings with the same
+    keys. Rows without a region use region auto-detection.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        with open(path, encoding="utf-8", newline="") as employee_file:
+            if extension == ".csv":
+                return list(csv.DictReader(employee_file))
+            if extension in (".yaml", ".yml"):
+                rows = yaml.safe_load(employee_file) or []
+                if not isinstance(rows, list):
+                    raise HomeAssistantError(f"{path} must contain a list of employees")
+                return rows
+    except (OSError, csv.Error, yaml.YAMLError) as err:
+        raise HomeAssistantError(f"Could not read {path}: {err}") from err
+    raise HomeAssistantError(f"Unsupported file type {extension}, use .csv, .yaml or .yml")
+
+
+async def async_import_employees(
+    hass: HomeAssistant, rows: List[Dict[str, Any]], concurrency: int
+) -> Dict[str, Any]:
+    """Validate all rows under bounded concurrency and create their entries.
+
+    A failing row is reported in the result and never stops the batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def import_row(index: int, row: Any) -> Dict[str, Any]:
+        email = row.get(CONF_EMAIL) if isinstance(row, dict) else None
+        report = {"row": index, "email": email}
+        try:
+            if not isinstance(row, dict):
+                raise vol.Invalid("expected a mapping")
+            # Empty CSV cells count as missing
+            data = ROW_SCHEMA({key: value for key, value in row.items() if value not in (None, "")})
+            async with semaphore:
+                info = await validate_input(hass, data)
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": SOURCE_IMPORT},
+                data={CONF_EMAIL: data[CONF_EMAIL], **info},
+            )
+        except vol.Invalid as err:
+            return {**report, "status": "failed", "error": f"Invalid row: {err}"}
+        except Exception as err:
+            _LOGGER.error(f"Import of row {index} ({email}) failed: {err}")
+            return {**report, "status": "failed", "error": str(err)}
+
+        if result["type"] == FlowResultType.CREATE_ENTRY:
+            return {**report, "status": "created"}
+        return {**report, "status": result.get("reason", "aborted")}
+
+    # Row numbers start at 1 for the first employee
+    reports = await asyncio.gather(
+        *(import_row(index, row) for index, row in enumerate(rows, start=1))
+    )
+
+    summary = {
+        "created": sum(1 for report in reports if report["status"] == "created"),
+        "failed": sum(1 for report in reports if report["status"] == "failed"),
+        "rows": list(reports),
+    }
+    _LOGGER.info(
+        f"Imported {summary['created']} of {len(reports)} employees, {summary['failed']} failed"
+    )
+    return summary
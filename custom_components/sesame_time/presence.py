@@ -0,0 +1,236 @@
+"""Company and area presence aggregates for Sesame Time."""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    DATA_PRESENCE,
+    ATTR_CHECKED_IN,
+    ATTR_CHECKED_OUT,
+    ATTR_PRESENT,
+)
+
+GROUP_COMPANY = "company"
+GROUP_AREA = "area"
+
+GroupKey = Tuple[str, str]
+
+
+@dataclass
+class PresenceGroup:
+    """Employees of one company or area, split by check status."""
+
+    name: str
+    present: Dict[str, str] = field(default_factory=dict)
+    absent: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class EmployeePresence:
+    """Last known presence of one employee."""
+
+    entry_id: str
+    name: str
+    groups: Tuple[GroupKey, ...]
+    is_checked_in: bool
+
+
+class PresenceAggregator:
+    """Keep per-group presence counts current by applying per-employee deltas.
+
+    Each status update only touches the groups the employee belongs to, so
+    its cost does not depend on how many employees are configured.
+
+    Group sensors are shared, but Home Assistant ties every entity to one
+    config entry: each sensor is owned by the entry of a group member. When
+    that entry unloads, ``async_handover`` moves the registry entry to
+    another member's entry, so deleting one employee keeps the sensor and
+    its customizations, and ``async_restore_sensors`` re-adds it right away.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._employees: Dict[str, EmployeePresence] = {}
+        self._groups: Dict[GroupKey, PresenceGroup] = {}
+        self._sensors: Dict[GroupKey, "SesameTimePresenceSensor"] = {}
+        self._add_entities: Dict[str, AddEntitiesCallback] = {}
+
+    def group(self, key: GroupKey) -> Optional[PresenceGroup]:
+        """Return a group by key."""
+        return self._groups.get(key)
+
+    @callback
+    def async_update(
+        self,
+        entry_id: str,
+        employee_id: str,
+        employee_name: str,
+        groups: Dict[GroupKey, str],
+        is_checked_in: bool,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Apply an employee's current status and group membership.
+
+        ``groups`` maps each group key the employee belongs to onto the
+        group's display name. Sensors for groups seen for the first time are
+        added through ``async_add_entities`` and owned by ``entry_id``.
+        """
+        self._add_entities[entry_id] = async_add_entities
+        previous = self._employees.get(employee_id)
+        changed: set = set()
+
+        if previous is not None:
+            for key in previous.groups:
+                if key not in groups or previous.is_checked_in != is_checked_in:
+                    self._leave(key, employee_id)
+                    changed.add(key)
+
+        new_sensors = []
+        for key, name in groups.items():
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = PresenceGroup(name)
+            if (
+                previous is None
+                or key not in previous.groups
+                or previous.is_checked_in != is_checked_in
+            ):
+                members = group.present if is_checked_in else group.absent
+                members[employee_id] = employee_name
+                changed.add(key)
+            if key not in self._sensors:
+                sensor = self._sensors[key] = SesameTimePresenceSensor(self, key, entry_id)
+                new_sensors.append(sensor)
+
+        self._employees[employee_id] = EmployeePresence(
+            entry_id, employee_name, tuple(groups), is_checked_in
+        )
+
+        if new_sensors:
+            async_add_entities(new_sensors)
+        self._async_notify(changed)
+
+    @callback
+    def async_remove(self, employee_id: str) -> None:
+        """Forget an employee, e.g. when its entry is unloaded."""
+        previous = self._employees.pop(employee_id, None)
+        if previous is None:
+            return
+        self._add_entities.pop(previous.entry_id, None)
+        for key in previous.groups:
+            self._leave(key, employee_id)
+        self._async_notify(set(previous.groups))
+
+    def _member_entry(self, key: GroupKey, exclude_entry_id: str) -> Optional[str]:
+        """Return the entry of a group member other than exclude_entry_id."""
+        group = self._groups.get(key)
+        if group is None:
+            return None
+        for employee_id in (*group.present, *group.absent):
+            entry_id = self._employees[employee_id].entry_id
+            if entry_id != exclude_entry_id and entry_id in self._add_entities:
+                return entry_id
+        return None
+
+    @callback
+    def async_handover(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Move the group sensors owned by an unloading entry to another member."""
+        registry = er.async_get(hass)
+        for key, sensor in self._sensors.items():
+            if sensor.owner_entry_id != entry_id or sensor.registry_entry is None:
+                continue
+            new_owner = self._member_entry(key, entry_id)
+            if new_owner is None:
+                # No other member, the group disappears with this entry
+                continue
+            registry.async_update_entity(sensor.entity_id, config_entry_id=new_owner)
+            sensor.owner_entry_id = new_owner
+
+    @callback
+    def async_restore_sensors(self) -> None:
+        """Re-add group sensors removed with their owner through another member."""
+        for key in self._groups:
+            if key in self._sensors:
+                continue
+            owner = self._member_entry(key, "")
+            if owner is None:
+                continue
+            sensor = self._sensors[key] = SesameTimePresenceSensor(self, key, owner)
+            self._add_entities[owner]([sensor])
+
+    @callback
+    def async_remove_sensor(self, key: GroupKey, sensor: "SesameTimePresenceSensor") -> None:
+        """Forget a removed sensor so the next update of its group re-adds it."""
+        if self._sensors.get(key) is sensor:
+            del self._sensors[key]
+
+    def _leave(self, key: GroupKey, employee_id: str) -> None:
+        """Remove an employee from a group, dropping the group once empty."""
+        group = self._groups[key]
+        group.present.pop(employee_id, None)
+        group.absent.pop(employee_id, None)
+        if not group.present and not group.absent:
+            del self._groups[key]
+
+    @callback
+    def _async_notify(self, keys: set) -> None:
+        """Write the state of the sensors of changed groups."""
+        for key in keys:
+            sensor = self._sensors.get(key)
+            if sensor is not None and sensor.hass is not None:
+                sensor.async_write_ha_state()
+
+
+class SesameTimePresenceSensor(SensorEntity):
+    """Number of checked in employees of a company or area."""
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:account-group"
+    _attr_native_unit_of_measurement = "people"
+
+    def __init__(
+        self, aggregator: PresenceAggregator, key: GroupKey, owner_entry_id: str
+    ) -> None:
+        """Initialize the sensor."""
+        self._aggregator = aggregator
+        self._key = key
+        # Config entry whose platform added this sensor
+        self.owner_entry_id = owner_entry_id
+        group_type, group_id = key
+
+        self._attr_name = f"{aggregator.group(key).name} Present"
+        self._attr_unique_id = f"presence_{group_type}_{group_id}"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of checked in employees."""
+        group = self._aggregator.group(self._key)
+        return len(group.present) if group else 0
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the checked in/out counts and who is present."""
+        group = self._aggregator.group(self._key)
+        if group is None:
+            return {ATTR_CHECKED_IN: 0, ATTR_CHECKED_OUT: 0, ATTR_PRESENT: []}
+        return {
+            ATTR_CHECKED_IN: len(group.present),
+            ATTR_CHECKED_OUT: len(group.absent),
+            ATTR_PRESENT: list(group.present.values()),
+        }
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister from the aggregator."""
+        self._aggregator.async_remove_sensor(self._key, self)
+
+
+@callback
+def async_get_presence(hass: HomeAssistant) -> PresenceAggregator:
+    """Return the shared presence aggregator, creating it if needed."""
+    if DATA_PRESENCE not in hass.data:
+        hass.data[DATA_PRESENCE] = PresenceAggregator()
+    return hass.data[DATA_PRESENCE]
@@ -0,0 +1,211 @@
+"""On-demand profiling of the Sesame Time hot paths."""
+import cProfile
+from contextlib import contextmanager
+import logging
+import os
+import pstats
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_PROFILER
+
+_LOGGER = logging.getLogger(__name__)
+
+CATEGORY_ENTITY_UPDATE = "entity_update"
+CATEGORY_SERVICE = "service"
+
+# Frames from this file are reported as SesameTimeAPI methods
+API_FILENAME = os.path.join("sesame_time", "api.py")
+
+
+class SesameTimeProfiler:
+    """Profile the next N cycles of the integration.
+
+    A cycle is either one service call or button press, or one poll round:
+    a round is complete once every polled entity has updated and one of
+    them comes around again. ``track`` is a no-op while no profile is
+    running, so instrumented code paths cost a single attribute check in
+    normal operation.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profiler."""
+        self._hass = hass
+        self._profile: Optional[cProfile.Profile] = None
+        self._remaining = 0
+        self._started = 0.0
+        self._timings: Dict[Tuple[str, str], List[float]] = {}
+        # Entities updated in the current poll round
+        self._round: Set[str] = set()
+        self._cancel_timeout: Optional[CALLBACK_TYPE] = None
+
+    @property
+    def active(self) -> bool:
+        """Return True while a profile is being captured."""
+        return self._profile is not None
+
+    @callback
+    def async_start(self, cycles: int, timeout: float) -> None:
+        """Start profiling until cycles cycles ran or timeout expired."""
+        if self.active:
+            raise HomeAssistantError("A Sesame Time profile is already running")
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as err:
+            # Only one profiler can run at a time, e.g. profiler.start is active
+            raise HomeAssistantError(f"Could not start the Sesame Time profile: {err}") from err
+
+        _LOGGER.info(f"Profiling the next {cycles} Sesame Time poll rounds and service calls (timeout {timeout}s)")
+        self._profile = profile
+        self._remaining = cycles
+        self._timings = {}
+        self._round = set()
+        self._started = time.monotonic()
+        self._cancel_timeout = async_call_later(self._hass, timeout, self._async_timeout)
+
+    @contextmanager
+    def track(self, category: str, name: str, entity_id: Optional[str] = None) -> Iterator[None]:
+        """Time a hot path while a profile is running.
+
+        Calls with an ``entity_id`` are polled entity updates and count
+        towards poll rounds, other calls count as one cycle each.
+        """
+        if not self.active:
+            yield
+            return
+
+        if entity_id is not None:
+            if entity_id in self._round:
+                # This entity comes around again: the previous round is complete
+                self._round = set()
+                self._count_cycle()
+            self._round.add(entity_id)
+            if not self.active:
+                yield
+                return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._timings.setdefault((category, name), []).append(elapsed)
+            if entity_id is None:
+                self._count_cycle()
+
+    def _count_cycle(self) -> None:
+        """Count a finished cycle and stop once enough ran."""
+        if self.active:
+            self._remaining -= 1
+            if self._remaining <= 0:
+                self._async_stop()
+
+    @callback
+    def _async_timeout(self, _now) -> None:
+        """Stop a profile that did not see enough cycles in time."""
+        self._cancel_timeout = None
+        if self.active:
+            _LOGGER.info("Sesame Time profile timed out, writing partial results")
+            self._async_stop()
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop profiling and write the results in the executor."""
+        profile = self._profile
+        profile.disable()
+        self._profile = None
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+            self._cancel_timeout = None
+
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        profile_path = self._hass.config.path(f"sesame_time_profile.{timestamp}.cprof")
+        summary_path = self._hass.config.path(f"sesame_time_profile.{timestamp}.txt")
+        duration = time.monotonic() - self._started
+        self._hass.async_create_task(
+            self._async_write(profile, dict(self._timings), duration, profile_path, summary_path)
+        )
+
+    async def _async_write(
+        self,
+        profile: cProfile.Profile,
+        timings: Dict[Tuple[str, str], List[float]],
+        duration: float,
+        profile_path: str,
+        summary_path: str,
+    ) -> None:
+        """Write the profile and its summary, then notify the user."""
+        try:
+            await self._hass.async_add_executor_job(
+                _write_results, profile, timings, duration, profile_path, summary_path
+            )
+        except (OSError, TypeError) as err:
+            # pstats raises TypeError for a profile without any data
+            _LOGGER.error(f"Could not write the Sesame Time profile: {err}")
+            persistent_notification.async_create(
+                self._hass,
+                f"Could not write the profile: {err}",
+                title="Sesame Time profile",
+            )
+            return
+        _LOGGER.info(f"Sesame Time profile written to {profile_path} and {summary_path}")
+        persistent_notification.async_create(
+            self._hass,
+            f"Profile written to `{profile_path}`, summary written to `{summary_path}`.",
+            title="Sesame Time profile",
+        )
+
+
+def _write_results(
+    profile: cProfile.Profile,
+    timings: Dict[Tuple[str, str], List[float]],
+    duration: float,
+    profile_path: str,
+    summary_path: str,
+) -> None:
+    """Dump the raw profile and a per-category summary."""
+    profile.dump_stats(profile_path)
+    stats = pstats.Stats(profile)
+
+    # Aggregate cumulative time of every SesameTimeAPI frame by method name
+    api_methods: Dict[str, Tuple[int, float]] = {}
+    for (filename, _lineno, function), (_cc, calls, _tt, cumtime, _callers) in stats.stats.items():
+        if filename.endswith(API_FILENAME):
+            count, total = api_methods.get(function, (0, 0.0))
+            api_methods[function] = (count + calls, total + cumtime)
+
+    lines = [f"Sesame Time profile over {duration:.1f}s", ""]
+    for category in (CATEGORY_ENTITY_UPDATE, CATEGORY_SERVICE):
+        lines.append(f"[{category}] (wall time per cycle)")
+        for (timing_category, name), samples in sorted(timings.items()):
+            if timing_category != category:
+                continue
+            lines.append(
+                f"  {name}: {len(samples)} calls, total {sum(samples) * 1000:.1f}ms, "
+                f"max {max(samples) * 1000:.1f}ms"
+            )
+        lines.append("")
+
+    lines.append("[SesameTimeAPI] (CPU time on the event loop, excluding awaited I/O)")
+    for function, (calls, cumtime) in sorted(
+        api_methods.items(), key=lambda item: item[1][1], reverse=True
+    ):
+        lines.append(f"  {function}: {calls} calls, cumulative {cumtime * 1000:.1f}ms")
+
+    with open(summary_path, "w", encoding="utf-8") as summary_file:
+        summary_file.write("\n".join(lines) + "\n")
+
+
+@callback
+def async_get_profiler(hass: HomeAssistant) -> SesameTimeProfiler:
+    """Return the shared profiler, creating it if needed."""
+    if DATA_PROFILER not in hass.data:
+        hass.data[DATA_PROFILER] = SesameTimeProfiler(hass)
+    return hass.data[DATA_PROFILER]
@@ -2,9 +2,11 @@
 import logging
 from typing import Any, Dict, Optional
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar, device_registry as dr
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 
@@ -19,8 +21,12 @@ from .const import (
     ATTR_WORK_STATUS,
     CONF_EMPLOYEE_ID,
     CONF_EMPLOYEE_NAME,
+    CONF_COMPANY_ID,
     CONF_COMPANY_NAME,
 )
+from .presence import GROUP_AREA, GROUP_COMPANY, async_get_presence
+from .profiler import CATEGORY_ENTITY_UPDATE, async_get_profiler
+from .worktime import WorkTimeTracker, async_get_ticker
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,13 +40,24 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][config_entry.entry_id]
     api = data["api"]
     entry_data = data["entry_data"]
+    tracker = data["tracker"]
     
     entities = [
         SesameTimeStatusSensor(
             api=api,
             entry_data=entry_data,
             entry_id=config_entry.entry_id,
-        )
+            tracker=tracker,
+            async_add_entities=async_add_entities,
+        ),
+        SesameTimeWorkedTodaySensor(
+            entry_data=entry_data,
+            tracker=tracker,
+        ),
+        SesameTimeCurrentSessionSensor(
+            entry_data=entry_data,
+            tracker=tracker,
+        ),
     ]
     
     async_add_entities(entities)
@@ -49,11 +66,14 @@ async def async_setup_entry(
 class SesameTimeStatusSensor(SensorEntity):
     """Sesame Time status sensor."""
 
-    def __init__(self, api, entry_data, entry_id):
+    def __init__(self, api, entry_data, entry_id, tracker, async_add_entities):
         """Initialize the sensor."""
         self._api = api
         self._entry_data = entry_data
         self._entry_id = entry_id
+        self._tracker = tracker
+        # Used to add company/area presence sensors on first sight
+        self._async_add_entities = async_add_entities
         self._state = None
         self._attributes = {}
         
@@ -89,9 +109,21 @@ class SesameTimeStatusSensor(SensorEntity):
     
     async def async_update(self) -> None:
         """Update the sensor."""
+        with async_get_profiler(self.hass).track(
+            CATEGORY_ENTITY_UPDATE, "status_sensor", self.entity_id
+        ):
+            await self._async_update_status()
+    
+    async def _async_update_status(self) -> None:
+        """Fetch the current status and update state and attributes."""
         try:
             result = await self._api.get_status()
-            
+
+            # Nothing changed since the last poll, keep the current state
+            if result.get("unchanged") and self._state is not None:
+                self._async_update_presence()
+                return
+
             if result.get("success"):
                 # Update state
                 if result.get("is_checked_in"):
@@ -107,8 +139,114 @@ class SesameTimeStatusSensor(SensorEntity):
                     ATTR_COMPANY_NAME: self._entry_data[CONF_COMPANY_NAME],
                     ATTR_WORK_STATUS: result.get("work_status"),
                 }
+                
+                # Feed the locally computed work time sensors
+                self._tracker.async_update(result)
+                self._async_update_presence()
             else:
                 _LOGGER.error(f"Failed to update status: {result.get('error')}")
                 
         except Exception as err:
-            _LOGGER.error(f"Error updating sensor: {err}")
\ No newline at end of file
+            _LOGGER.error(f"Error updating sensor: {err}")
+    
+    def _async_update_presence(self) -> None:
+        """Apply this employee's status to the company and area aggregates."""
+        if self._state is None:
+            return
+        
+        groups = {
+            (GROUP_COMPANY, self._entry_data[CONF_COMPANY_ID]): self._entry_data[CONF_COMPANY_NAME],
+        }
+        area_id = self._area_id()
+        if area_id is not None:
+            area = ar.async_get(self.hass).async_get_area(area_id)
+            if area is not None:
+                groups[(GROUP_AREA, area_id)] = area.name
+        
+        async_get_presence(self.hass).async_update(
+            self._entry_id,
+            self._entry_data[CONF_EMPLOYEE_ID],
+            self._entry_data[CONF_EMPLOYEE_NAME],
+            groups,
+            self._state == STATE_CHECKED_IN,
+            self._async_add_entities,
+        )
+    
+    def _area_id(self) -> Optional[str]:
+        """Return the area of this entity, falling back to its device's area."""
+        entry = self.registry_entry
+        if entry is None:
+            return None
+        if entry.area_id:
+            return entry.area_id
+        if entry.device_id:
+            device = dr.async_get(self.hass).async_get(entry.device_id)
+            if device is not None:
+                return device.area_id
+        return None
+    
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove this employee from the presence aggregates."""
+        async_get_presence(self.hass).async_remove(self._entry_data[CONF_EMPLOYEE_ID])
+
+
+class SesameTimeDurationSensor(SensorEntity):
+    """Base class for work time sensors computed locally from the last status."""
+
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, entry_data, tracker: WorkTimeTracker, key: str, name: str):
+        """Initialize the sensor."""
+        self._tracker = tracker
+        
+        employee_name = entry_data[CONF_EMPLOYEE_NAME]
+        company_name = entry_data[CONF_COMPANY_NAME]
+        employee_id = entry_data[CONF_EMPLOYEE_ID]
+        
+        self._attr_name = f"{employee_name} {name}"
+        self._attr_unique_id = f"{employee_id}_{key}"
+        
+        # Device info
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, employee_id)},
+            name=f"{employee_name} ({company_name})",
+            manufacturer="Sesame Time",
+            model="Employee",
+            sw_version="1.0",
+        )
+    
+    async def async_added_to_hass(self) -> None:
+        """Refresh on status changes and on the shared ticker, never polling the API."""
+        self.async_on_remove(self._tracker.async_add_listener(self.async_write_ha_state))
+        self.async_on_remove(
+            async_get_ticker(self.hass).async_add_listener(self.async_write_ha_state)
+        )
+
+
+class SesameTimeWorkedTodaySensor(SesameTimeDurationSensor):
+    """Time worked today."""
+
+    def __init__(self, entry_data, tracker: WorkTimeTracker):
+        """Initialize the sensor."""
+        super().__init__(entry_data, tracker, "worked_today", "Worked Today")
+    
+    @property
+    def native_value(self) -> int:
+        """Return the minutes worked today."""
+        return int(self._tracker.worked_today().total_seconds() // 60)
+
+
+class SesameTimeCurrentSessionSensor(SesameTimeDurationSensor):
+    """Duration of the current work session."""
+
+    def __init__(self, entry_data, tracker: WorkTimeTracker):
+        """Initialize the sensor."""
+        super().__init__(entry_data, tracker, "current_session", "Current Session")
+    
+    @property
+    def native_value(self) -> int:
+        """Return the minutes since the last check-in, zero if checked out."""
+        return int(self._tracker.current_session().total_seconds() // 60)
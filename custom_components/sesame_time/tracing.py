@@ -0,0 +1,111 @@
+"""Sampled request tracing for the Sesame Time API client."""
+from collections import deque
+import json
+import random
+import time
+from typing import Any, Deque, Dict, List, Optional
+
+try:
+    from .const import DEFAULT_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SIZE
+except ImportError:
+    # For standalone testing
+    from const import DEFAULT_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SIZE
+
+REDACTED = "**REDACTED**"
+
+# Header, cookie and body keys whose values never reach the trace buffer,
+# compared lowercased: credentials, session tokens and personal data
+REDACT_KEYS = {
+    "cookie",
+    "set-cookie",
+    "usid",
+    "password",
+    "token",
+    "email",
+    "firstname",
+    "lastname",
+    "fullname",
+    "phone",
+}
+
+# Response bodies are truncated to keep the buffer small
+MAX_BODY_LENGTH = 2048
+
+
+def _redact(value: Any) -> Any:
+    """Recursively redact sensitive keys from a JSON-like value."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if str(key).lower() in REDACT_KEYS else _redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+def _redact_body(body: Optional[str]) -> Optional[str]:
+    """Redact and truncate a raw response body."""
+    if body is None:
+        return None
+    try:
+        body = json.dumps(_redact(json.loads(body)))
+    except ValueError:
+        pass
+    if len(body) > MAX_BODY_LENGTH:
+        return f"{body[:MAX_BODY_LENGTH]}... ({len(body)} chars)"
+    return body
+
+
+class RequestTracer:
+    """Bounded ring buffer of sampled request/response exchanges.
+
+    Callers check ``sample()`` before doing any work so unsampled requests
+    pay only for a random draw; redaction and formatting happen only for
+    the exchanges that are actually recorded.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_TRACE_SIZE,
+        sample_rate: float = DEFAULT_TRACE_SAMPLE_RATE,
+    ) -> None:
+        """Initialize the tracer."""
+        self._traces: Deque[Dict[str, Any]] = deque(maxlen=max(size, 1))
+        self._sample_rate = sample_rate
+
+    def sample(self) -> bool:
+        """Return True if the next request should be traced."""
+        if self._sample_rate <= 0:
+            return False
+        return self._sample_rate >= 1 or random.random() < self._sample_rate
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        data: Optional[Dict[str, Any]],
+        status: Optional[int],
+        response_body: Optional[str],
+        elapsed: float,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record one exchange, redacting tokens, cookies and credentials."""
+        self._traces.append({
+            "timestamp": time.time(),
+            "method": method,
+            "url": url,
+            "request_headers": _redact(headers),
+            "request_cookies": {key: REDACTED for key in cookies},
+            "request_body": _redact(data),
+            "status": status,
+            "response_body": _redact_body(response_body),
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "error": error,
+        })
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return the recorded exchanges, oldest first."""
+        return list(self._traces)
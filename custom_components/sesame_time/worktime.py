@@ -0,0 +1,175 @@
+"""Local work time tracking for Sesame Time."""
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DATA_TICKER, WORK_TIME_TICK_INTERVAL
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+
+def _store(hass: HomeAssistant, employee_id: str) -> Store:
+    """Return the store holding an employee's closed sessions of the day."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.worktime.{employee_id}")
+
+
+async def async_remove_work_time(hass: HomeAssistant, employee_id: str) -> None:
+    """Delete the stored sessions of a removed employee."""
+    await _store(hass, employee_id).async_remove()
+
+
+class WorkTimeTracker:
+    """Track worked time for one employee from already fetched status data.
+
+    Only the last check is returned by the API, so closed sessions of the
+    day are persisted to survive restarts and entry reloads.
+    """
+
+    def __init__(self, hass: HomeAssistant, employee_id: str) -> None:
+        """Initialize the tracker."""
+        self._store = _store(hass, employee_id)
+        self._raw_check_in: Optional[str] = None
+        self._raw_check_out: Optional[str] = None
+        self._check_in: Optional[datetime] = None
+        self._check_out: Optional[datetime] = None
+        # Closed sessions seen so far, keyed by their check-in datetime
+        self._closed_sessions: Dict[datetime, datetime] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    async def async_load(self) -> None:
+        """Restore the closed sessions saved earlier today."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        for raw_check_in, raw_check_out in data.get("closed_sessions", []):
+            check_in = dt_util.parse_datetime(raw_check_in)
+            check_out = dt_util.parse_datetime(raw_check_out)
+            if check_in and check_out:
+                self._closed_sessions[check_in] = check_out
+        self._prune()
+
+    def _prune(self) -> None:
+        """Forget sessions that ended before today."""
+        start_of_day = dt_util.start_of_local_day()
+        self._closed_sessions = {
+            check_in: check_out
+            for check_in, check_out in self._closed_sessions.items()
+            if check_out > start_of_day
+        }
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the closed sessions to persist."""
+        return {
+            "closed_sessions": [
+                [check_in.isoformat(), check_out.isoformat()]
+                for check_in, check_out in self._closed_sessions.items()
+            ]
+        }
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for changes of the tracked check."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update(self, status: Dict[str, Any]) -> None:
+        """Update the tracker from a get_status() result."""
+        raw_check_in = status.get("last_check_in")
+        raw_check_out = status.get("last_check_out")
+        if raw_check_in == self._raw_check_in and raw_check_out == self._raw_check_out:
+            return
+
+        self._raw_check_in = raw_check_in
+        self._raw_check_out = raw_check_out
+        self._check_in = dt_util.parse_datetime(raw_check_in) if raw_check_in else None
+        self._check_out = dt_util.parse_datetime(raw_check_out) if raw_check_out else None
+
+        if self._check_in and self._check_out:
+            self._closed_sessions[self._check_in] = self._check_out
+        self._prune()
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @property
+    def is_checked_in(self) -> bool:
+        """Return True if the last check is still open."""
+        return self._check_in is not None and self._check_out is None
+
+    def current_session(self, now: Optional[datetime] = None) -> timedelta:
+        """Return the duration of the open session, zero if checked out."""
+        if not self.is_checked_in:
+            return timedelta()
+        now = now or dt_util.now()
+        return max(now - self._check_in, timedelta())
+
+    def worked_today(self, now: Optional[datetime] = None) -> timedelta:
+        """Return the time worked today, including the open session."""
+        now = now or dt_util.now()
+        start_of_day = dt_util.start_of_local_day()
+        sessions = dict(self._closed_sessions)
+        if self.is_checked_in:
+            sessions[self._check_in] = now
+
+        worked = timedelta()
+        for check_in, check_out in sessions.items():
+            # Only count the part of the session that falls within today
+            start = max(check_in, start_of_day)
+            if check_out > start:
+                worked += check_out - start
+        return worked
+
+
+class WorkTimeTicker:
+    """Single timer shared by every work time sensor."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the ticker."""
+        self._hass = hass
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Call update_callback on every tick until removed."""
+        self._listeners.append(update_callback)
+        if self._unsub is None:
+            self._unsub = async_track_time_interval(
+                self._hass, self._async_tick, WORK_TIME_TICK_INTERVAL
+            )
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+            if not self._listeners and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return remove_listener
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Notify all listeners."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+@callback
+def async_get_ticker(hass: HomeAssistant) -> WorkTimeTicker:
+    """Return the shared work time ticker, creating it if needed."""
+    if DATA_TICKER not in hass.data:
+        hass.data[DATA_TICKER] = WorkTimeTicker(hass)
+    return hass.data[DATA_TICKER]
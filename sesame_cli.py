@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Command-line client for Sesame Time, usable without Home Assistant.
+
+Runs one command for every employee of a credentials file concurrently and
+prints one JSON object per employee (NDJSON) as soon as it finishes.
+
+Examples:
+    python sesame_cli.py -c employees.csv status
+    python sesame_cli.py -c employees.json --workers 20 check-in --latitude 40.4168 --longitude -3.7038
+    python sesame_cli.py -c employees.csv history --days 7
+"""
+
+import argparse
+import asyncio
+import csv
+from datetime import date, timedelta
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, List
+
+import aiohttp
+
+# Add the custom_components path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'custom_components', 'sesame_time'))
+
+from api import SesameTimeAPI, probe_regions
+from const import REGIONS, REGION_AUTO
+
+def load_credentials(path: str) -> List[Dict[str, Any]]:
+    """Read employees from a CSV, JSON or YAML file.
+
+    Each employee needs ``email`` and ``password``; ``region`` is optional
+    and auto-detected when missing.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding="utf-8", newline="") as credentials_file:
+        if extension == ".csv":
+            rows = list(csv.DictReader(credentials_file))
+        elif extension == ".json":
+            rows = json.load(credentials_file)
+        elif extension in (".yaml", ".yml"):
+            import yaml  # Optional, only needed for YAML files
+            rows = yaml.safe_load(credentials_file) or []
+        else:
+            raise ValueError(f"Unsupported credentials file {path}, use .csv, .json, .yaml or .yml")
+
+    if not isinstance(rows, list):
+        raise ValueError(f"{path} must contain a list of employees")
+    return rows
+
+
+async def run_employee(
+    session: aiohttp.ClientSession,
+    row: Dict[str, Any],
+    args: argparse.Namespace,
+) -> Dict[str, Any]:
+    """Log in one employee and run the command."""
+    email = (row.get("email") or "").strip()
+    password = row.get("password") or ""
+    region = (row.get("region") or REGION_AUTO).strip().lower()
+    report = {"email": email, "command": args.command}
+
+    if not email or not password:
+        return {**report, "success": False, "error": "Missing email or password"}
+    if region != REGION_AUTO and region not in REGIONS:
+        return {**report, "success": False, "error": f"Unknown region {region}"}
+
+    # Login
+    if region == REGION_AUTO:
+        login_result = await probe_regions(session, email, password, REGIONS)
+        if not login_result.get("success"):
+            return {**report, "success": False, "error": login_result.get("error")}
+        region = login_result["region"]
+        api = SesameTimeAPI(session, region, token=login_result["token"])
+    else:
+        api = SesameTimeAPI(session, region)
+        login_result = await api.login(email, password)
+        if not login_result.get("success"):
+            return {**report, "success": False, "error": login_result.get("error")}
+    report["region"] = region
+
+    # Get user info, which also sets the employee and company IDs. The
+    # status is built from the same /security/me response
+    if args.command == "status":
+        user_result = await api.get_status()
+    else:
+        user_result = await api.get_me()
+    if not user_result.get("success"):
+        return {**report, "success": False, "error": user_result.get("error")}
+    report["employee_name"] = user_result.get("employee_name")
+
+    if args.command == "status":
+        result = user_result
+    elif args.command == "check-in":
+        result = await api.check_in(
+            latitude=args.latitude,
+            longitude=args.longitude,
+            work_check_type=args.work_check_type,
+        )
+    elif args.command == "check-out":
+        result = await api.check_out(latitude=args.latitude, longitude=args.longitude)
+    else:
+        today = date.today()
+        result = await api.get_checks(
+            (today - timedelta(days=args.days - 1)).isoformat(), today.isoformat()
+        )
+
+    return {**report, **result}
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run the command for every employee, streaming NDJSON results."""
+    rows = load_credentials(args.credentials)
+    semaphore = asyncio.Semaphore(args.workers)
+    failures = 0
+
+    async def worker(row: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await run_employee(session, row, args)
+            except Exception as err:
+                return {"email": row.get("email"), "command": args.command, "success": False, "error": str(err)}
+
+    # Each auto-detecting worker races one login per region
+    connector = aiohttp.TCPConnector(limit=args.workers * len(REGIONS))
+    async with aiohttp.ClientSession(connector=connector) as session:
+        for finished in asyncio.as_completed([worker(row) for row in rows]):
+            result = await finished
+            if not result.get("success"):
+                failures += 1
+            sys.stdout.write(json.dumps(result, default=str) + "\n")
+            sys.stdout.flush()
+
+    return 1 if failures else 0
+
+
+def main() -> int:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--credentials", required=True, help="CSV, JSON or YAML file with email, password and optional region")
+    parser.add_argument("-w", "--workers", type=int, default=10, help="Maximum employees processed at the same time (default: 10)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log API errors to stderr")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("status", help="Show whether each employee is checked in")
+    for command in ("check-in", "check-out"):
+        punch_parser = subparsers.add_parser(command, help=f"Perform a {command} for every employee")
+        punch_parser.add_argument("--latitude", type=float)
+        punch_parser.add_argument("--longitude", type=float)
+        if command == "check-in":
+            punch_parser.add_argument("--work-check-type", help="Work check type name, e.g. a break")
+    history_parser = subparsers.add_parser("history", help="List each employee's recent checks")
+    history_parser.add_argument("--days", type=int, default=7, help="Number of days including today (default: 7)")
+
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.command == "history" and args.days < 1:
+        parser.error("--days must be at least 1")
+    if args.command != "check-in":
+        args.work_check_type = None
+
+    # API errors go to stderr so stdout stays valid NDJSON
+    logging.basicConfig(
+        level=logging.ERROR if args.verbose else logging.CRITICAL,
+        stream=sys.stderr,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())